@@ -10,19 +10,13 @@ string being printed.
 e.g. python example_check.py ./app
 """
 import importlib.util
-import logging
 from os import path as osp
 import os
 import shutil
 import sys
-import subprocess
 
-from tornado.ioloop import IOLoop
-from traitlets import Bool, Dict, Unicode
-from jupyter_server.serverapp import ServerApp
 from jupyterlab.labapp import get_app_dir
 from jupyterlab.browser_check import run_test, run_async_process
-from jupyter_server.serverapp import ServerApp
 
 
 here = osp.abspath(osp.dirname(__file__))
@@ -74,8 +68,7 @@ async def run_browser(url):
     # Run the browser test and return an exit code.
     target = osp.join(get_app_dir(), 'example_test')
     if not osp.exists(osp.join(target, 'node_modules')):
-        if not osp.exists(target):
-            os.makedirs(osp.join(target))
+        os.makedirs(target, exist_ok=True)
         await run_async_process(["npm", "init", "-y"], cwd=target)
         await run_async_process(["npm", "install", "puppeteer@^4"], cwd=target)
     shutil.copy(osp.join(here, 'chrome-example-test.js'), osp.join(target, 'chrome-example-test.js'))
@@ -3,9 +3,25 @@
 # Copyright (c) Jupyter Development Team.
 # Distributed under the terms of the Modified BSD License.
 
+import sys
+
 from ._version import __version__
-from .labapp import LabApp
-from .serverextension import load_jupyter_server_extension
+
+if sys.version_info < (3, 7):
+    # Module level __getattr__ (PEP 562) needs Python 3.7.
+    from .labapp import LabApp
+    from .serverextension import load_jupyter_server_extension
+else:
+    def __getattr__(name):
+        # Import the server application lazily, so that light entry points
+        # such as `jlpm` do not load the whole server stack.
+        if name == 'LabApp':
+            from .labapp import LabApp
+            return LabApp
+        if name == 'load_jupyter_server_extension':
+            from .serverextension import load_jupyter_server_extension
+            return load_jupyter_server_extension
+        raise AttributeError('module %r has no attribute %r' % (__name__, name))
 
 
 def _jupyter_server_extension_paths():
@@ -17,9 +33,10 @@ def _jupyter_server_extension_paths():
 
 
 def _jupyter_server_extension_points():
+    from .labapp import LabApp
     return [
         {
             'module': 'jupyterlab',
             'app': LabApp
         }
-    ]
\ No newline at end of file
+    ]
@@ -12,7 +12,6 @@ import shutil
 import subprocess
 import sys
 import time
-from concurrent.futures import ThreadPoolExecutor
 from os import path as osp
 
 from jupyter_server.serverapp import aliases, flags
@@ -101,8 +100,7 @@ async def run_test_async(app, func):
     else:
         app.log.info('Using thread pool executor to run test')
         loop = asyncio.get_event_loop()
-        executor = ThreadPoolExecutor()
-        task = loop.run_in_executor(executor, func, url)
+        task = loop.run_in_executor(None, func, url)
         test = asyncio.wait([task])
 
     try:
@@ -149,8 +147,7 @@ async def run_browser(url):
     """
     target = osp.join(get_app_dir(), 'browser_test')
     if not osp.exists(osp.join(target, 'node_modules')):
-        if not osp.exists(target):
-            os.makedirs(osp.join(target))
+        os.makedirs(target, exist_ok=True)
         await run_async_process(["jlpm", "init", "-y"], cwd=target)
         await run_async_process(["jlpm", "add", "playwright@^1.9.2"], cwd=target)
     shutil.copy(osp.join(here, 'browser-test.js'), osp.join(target, 'browser-test.js'))
@@ -162,7 +159,7 @@ def run_browser_sync(url):
     """
     target = osp.join(get_app_dir(), 'browser_test')
     if not osp.exists(osp.join(target, 'node_modules')):
-        os.makedirs(target)
+        os.makedirs(target, exist_ok=True)
         subprocess.call(["jlpm", "init", "-y"], cwd=target)
         subprocess.call(["jlpm", "add", "playwright@^1.9.2"], cwd=target)
     shutil.copy(osp.join(here, 'browser-test.js'), osp.join(target, 'browser-test.js'))
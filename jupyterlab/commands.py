@@ -109,18 +109,21 @@ class ProgressProcess(Process):
         proc = self.proc
         kill_event = self._kill_event
         spinner = itertools.cycle(['-', '\\', '|', '/'])
-        while proc.poll() is None:
+        while True:
             sys.stdout.write(next(spinner))   # write the next character
             sys.stdout.flush()                # flush stdout buffer (actual character display)
             sys.stdout.write('\b')
             if kill_event.is_set():
                 self.terminate()
                 raise ValueError('Process was aborted')
+            # `communicate` waits for the process itself, so there is no need
+            # to poll it, and it keeps the partial output between timeouts.
             try:
                 out, _ = proc.communicate(timeout=.1)
-                cache.append(out)
             except subprocess.TimeoutExpired:
                 continue
+            cache.append(out)
+            break
         self.logger.debug('\n'.join(cache))
         sys.stdout.flush()
         return self.terminate()
@@ -2407,7 +2410,7 @@ def _fetch_package_metadata(registry, name, logger):
         logger.debug('Fetching URL: %s' % (req.get_full_url()))
     try:
         with contextlib.closing(urlopen(req)) as response:
-            return json.loads(response.read().decode('utf-8'))
+            return json.load(response)
     except URLError as exc:
         logger.warning(
             'Failed to fetch package metadata for %r: %r',
@@ -6,12 +6,48 @@
 import sys
 
 import os
-from jupyterlab_server.process import which, subprocess
+import subprocess
+from shutil import which as _which
 
 HERE = os.path.dirname(os.path.abspath(__file__))
 YARN_PATH = os.path.join(HERE, 'staging', 'yarn.js')
 
 
+def which(command, env=None):
+    """Get the full path to a command.
+
+    This mirrors `jupyterlab_server.process.which`, which is not used here
+    because importing `jupyterlab_server` loads the whole server stack.
+    Keep the two in sync.
+
+    Parameters
+    ----------
+    command: str
+        The command name or path.
+    env: dict, optional
+        The environment variables, defaults to `os.environ`.
+    """
+    env = env or os.environ
+    path = env.get('PATH') or os.defpath
+    command_with_path = _which(command, path=path)
+
+    # Allow nodejs as an alias to node.
+    if command == 'node' and not command_with_path:
+        command = 'nodejs'
+        command_with_path = _which('nodejs', path=path)
+
+    if not command_with_path:
+        if command in ['nodejs', 'node', 'npm']:
+            msg = ('Please install Node.js and npm before continuing '
+                   'installation. You may be able to install Node.js from '
+                   'your package manager, from conda, or directly from the '
+                   'Node.js website (https://nodejs.org).')
+            raise ValueError(msg)
+        raise ValueError('The command was not found or was not executable: '
+                         '%s.' % command)
+    return os.path.abspath(command_with_path)
+
+
 def execvp(cmd, argv):
     """Execvp, except on Windows where it uses Popen.
 
@@ -19,20 +55,20 @@ def execvp(cmd, argv):
     associated with the file being executed.
 
     Python provides execvp on Windows, but its behavior is problematic
-    (Python bug#9148).
+    (Python bug#9148).  There the child inherits our stdio handles and
+    we exit with its return code once it is done.
     """
     cmd = which(cmd)
     if os.name == 'nt':
         import signal
-        import sys
         p = subprocess.Popen([cmd] + argv[1:])
         # Don't raise KeyboardInterrupt in the parent process.
         # Set this after spawning, to avoid subprocess inheriting handler.
         signal.signal(signal.SIGINT, signal.SIG_IGN)
-        p.wait()
-        sys.exit(p.returncode)
+        sys.exit(p.wait())
     else:
-        os.execvp(cmd, argv)
+        # `cmd` is already resolved, so skip the PATH search.
+        os.execv(cmd, argv)
 
 
 def main(argv=None):
@@ -40,4 +76,8 @@ def main(argv=None):
     """
     # Make sure node is available.
     argv = argv or sys.argv[1:]
-    execvp('node', ['node', YARN_PATH] + argv)
+    try:
+        node = which('node')
+    except ValueError as e:
+        sys.exit(str(e))
+    execvp(node, [node, YARN_PATH] + argv)
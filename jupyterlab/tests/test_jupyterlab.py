@@ -19,6 +19,7 @@ from unittest.mock import patch
 
 import pytest
 from jupyter_core import paths
+import jupyterlab
 from jupyterlab import commands
 from jupyterlab.commands import (
     AppOptions, _compare_ranges, _test_overlap,
@@ -802,3 +803,48 @@ def test_load_extension(jp_serverapp, make_lab_app):
     app._link_jupyter_server_extension(jp_serverapp)
     app.initialize()
     sys.stderr = stderr
+
+
+def test_server_entry_points():
+    from jupyterlab import LabApp, load_jupyter_server_extension
+    from jupyterlab.labapp import LabApp as _LabApp
+    from jupyterlab.serverextension import (
+        load_jupyter_server_extension as _load_jupyter_server_extension
+    )
+    assert LabApp is _LabApp
+    assert load_jupyter_server_extension is _load_jupyter_server_extension
+    points = jupyterlab._jupyter_server_extension_points()
+    assert points[0]['app'] is _LabApp
+
+
+@pytest.mark.skipif(sys.version_info < (3, 7),
+                    reason='lazy imports need module __getattr__')
+def test_jlpm_does_not_import_server():
+    # `jlpm` runs for every yarn command, keep its import path light.
+    code = 'import sys, jupyterlab.jlpmapp; print("jupyter_server" in sys.modules)'
+    output = subprocess.check_output([sys.executable, '-c', code])
+    assert output.decode('utf8').strip() == 'False'
+
+
+@pytest.mark.skipif(os.name == 'nt', reason='uses POSIX executables')
+@pytest.mark.parametrize('names', [['node'], ['nodejs'], ['node', 'nodejs'], []])
+def test_jlpm_which_matches_server(tmp_path, names):
+    # jlpmapp keeps its own copy of `which`, check it against upstream.
+    from jupyterlab_server.process import which as server_which
+    from jupyterlab.jlpmapp import which
+
+    for name in names:
+        exe = tmp_path / name
+        exe.write_text('#!/bin/sh\n')
+        exe.chmod(0o755)
+    env = dict(PATH=str(tmp_path))
+
+    for command in ['node', 'nodejs', 'npm']:
+        try:
+            expected = server_which(command, env=env)
+        except ValueError as e:
+            with pytest.raises(ValueError) as info:
+                which(command, env=env)
+            assert str(info.value) == str(e)
+        else:
+            assert which(command, env=env) == expected
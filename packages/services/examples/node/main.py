@@ -34,7 +34,7 @@ class NodeApp(ProcessApp):
             token=self.settings['token'])
 
         with open(osp.join(HERE, 'config.json'), 'w') as fid:
-            json.dump(config, fid)
+            fid.write(json.dumps(config))
 
         cmd = [which('node'),
                'index.js', '--jupyter-config-data=./config.json']